@@ -1,6 +1,23 @@
 #!/usr/bin/env python
 
+import os
+from typing import Any, List
+
 import setuptools
 
+# Experimental, optional compiled build of the transaction construction modules: set USE_CYTHON=1 (with Cython installed) before building.
+# It shows no measurable speedup so far (see README.dev.md). The plain Python modules remain the default. annotation_typing is disabled so that Cython doesn't turn parameter annotations into
+# C-level argument checks: those would raise a bare TypeError before the RP2TypeError checks in the code get a chance to run.
+CYTHON_MODULES: List[str] = ["src/rp2/in_transaction.py", "src/rp2/rp2_decimal.py"]
+
+
+def get_ext_modules() -> List[Any]:
+    if not os.environ.get("USE_CYTHON"):
+        return []
+    from Cython.Build import cythonize  # pylint: disable=import-outside-toplevel
+
+    return cythonize(CYTHON_MODULES, compiler_directives={"language_level": "3", "annotation_typing": False})
+
+
 if __name__ == "__main__":
-    setuptools.setup()
+    setuptools.setup(ext_modules=get_ext_modules())
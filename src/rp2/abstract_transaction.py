@@ -23,6 +23,17 @@ from rp2.rp2_error import RP2TypeError
 
 
 class AbstractTransaction(AbstractEntry):
+    __slots__ = (
+        "__timestamp",
+        "__transaction_type",
+        "__spot_price",
+        "__row",
+        "__internal_id",
+        "__unique_id",
+        "__notes",
+        "__cached_hash",
+    )
+
     def __init__(
         self,
         configuration: Configuration,
@@ -43,7 +54,16 @@ class AbstractTransaction(AbstractEntry):
         self.__row: int = configuration.type_check_internal_id("row", row) if row is not None else id(self)
         self.__internal_id: int = self.__row
         self.__unique_id: str = configuration.type_check_string_or_integer("unique_id", unique_id) if unique_id is not None else ""
-        self.__notes = configuration.type_check_string("notes", notes) if notes else ""
+        # Fast path for the common cases (string or no notes): the full type check only runs to raise the error
+        self.__notes: str
+        if isinstance(notes, str):
+            self.__notes = notes
+        elif notes:
+            # Disable mypy because otherwise it warns about unreachable code (we still want this runtime check)
+            self.__notes = configuration.type_check_string("notes", notes)  # type: ignore
+        else:
+            self.__notes = ""
+        self.__cached_hash: Optional[int] = None
 
     @classmethod
     def type_check(cls, name: str, instance: "AbstractEntry") -> "AbstractEntry":
@@ -71,7 +91,10 @@ class AbstractTransaction(AbstractEntry):
     def __hash__(self) -> int:
         # By definition, internal_id can uniquely identify a transaction: this works even if it's the ODS line from the spreadsheet,
         # since there are no cross-asset transactions (so a spreadsheet line points to a unique transaction for that asset).
-        return hash(self.internal_id)
+        # internal_id never changes after construction, so the hash is computed once.
+        if self.__cached_hash is None:
+            self.__cached_hash = hash(self.internal_id)
+        return self.__cached_hash
 
     def to_string(self, indent: int = 0, repr_format: bool = True, extra_data: Optional[List[str]] = None) -> str:
         class_specific_data: List[str] = []
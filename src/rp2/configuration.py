@@ -13,14 +13,18 @@
 # limitations under the License.
 
 import json
+import re
+import time
 from configparser import ConfigParser, SectionProxy
 from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
+from sys import intern
 from threading import Lock
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Match, Optional, Pattern, Set
 
 from dateutil.parser import parse
+from dateutil.tz import tzlocal, tzoffset, tzutc
 from jsonschema import validate
 
 from rp2.abstract_country import AbstractCountry
@@ -114,6 +118,10 @@ _HEADER_COLUMNS: Dict[str, Set[str]] = {
     },
 }
 
+# Timestamp shapes parsed without dateutil in type_check_timestamp_from_string(): a strict subset of what dateutil accepts, i.e.
+# YYYY-MM-DD, "T" or space, HH:MM[:SS[.ffffff]], optional space, then "Z" or a +/-HH:MM (or +/-HHMM) offset. Anything else goes to dateutil.
+_FAST_PATH_TIMESTAMP_RE: Pattern[str] = re.compile(r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)? ?(?:Z|([+-])(\d{2}):?(\d{2}))")
+
 
 class Configuration:  # pylint: disable=too-many-public-methods
     @classmethod
@@ -237,8 +245,9 @@ class Configuration:  # pylint: disable=too-many-public-methods
                 raise RP2ValueError(f"{configuration_path}: field '{field_name}' in section '{section.name}' cannot contain non-string elements")
             if element in result:
                 raise RP2ValueError(f"{configuration_path}: field '{field_name}' in section '{section.name}' contains duplicate elements: {element}")
-            result.add(element)
-        return set(list_as_values)
+            # Interned so that membership checks against identical names (e.g. from Python literals) hit the identity fast path
+            result.add(intern(element))
+        return result
 
     def _validate_header_section(self, section: SectionProxy, normalized_section_name: str, configuration_path: str) -> Dict[str, int]:
         if not section:
@@ -382,14 +391,44 @@ class Configuration:  # pylint: disable=too-many-public-methods
     @classmethod
     def type_check_timestamp_from_string(cls, name: str, value: str) -> datetime:
         cls.type_check_string(name, value)
-        try:
-            result: datetime = parse(value)
-        except Exception as exc:
-            raise RP2ValueError(f"Error parsing parameter '{name}': {str(exc)}") from exc
+        result: Optional[datetime] = cls._parse_timestamp_fast_path(value)
+        if result is None:
+            try:
+                result = parse(value)
+            except Exception as exc:
+                raise RP2ValueError(f"Error parsing parameter '{name}': {str(exc)}") from exc
         if result.tzinfo is None:
             raise RP2ValueError(f"Parameter '{name}' value has no timezone info: {value}")
         return result
 
+    # Parses the timestamp shapes matched by _FAST_PATH_TIMESTAMP_RE much faster than dateutil, returning the same datetime and tzinfo
+    # class dateutil would. Returns None for any other input (including out-of-range fields), so that dateutil parses it or reports the error.
+    @staticmethod
+    def _parse_timestamp_fast_path(value: str) -> Optional[datetime]:
+        match: Optional[Match[str]] = _FAST_PATH_TIMESTAMP_RE.fullmatch(value)
+        if match is None:
+            return None
+        year, month, day, hour, minute, second, fraction, offset_sign, offset_hours, offset_minutes = match.groups()
+        try:
+            result: datetime = datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second) if second else 0, int(fraction.ljust(6, "0")) if fraction else 0
+            )
+        except ValueError:
+            return None
+        offset: int = 0
+        if offset_sign is not None:
+            if int(offset_hours) > 23 or int(offset_minutes) > 59:
+                return None
+            offset = (int(offset_hours) * 3600 + int(offset_minutes) * 60) * (-1 if offset_sign == "-" else 1)
+        if offset:
+            return result.replace(tzinfo=tzoffset(None, offset))
+        # Like dateutil, use tzlocal() for a zero offset if the local timezone is called UTC (and is UTC at this date), tzutc() otherwise
+        if "UTC" in time.tzname:
+            local_result: datetime = result.replace(tzinfo=tzlocal())
+            if local_result.tzname() == "UTC":
+                return local_result
+        return result.replace(tzinfo=tzutc())
+
     def type_check_exchange(self, name: str, value: str) -> str:
         self.type_check_string(name, value)
         if value not in self.__exchanges:
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional, Set
 
 from rp2.configuration import Configuration
@@ -42,9 +43,10 @@ class TransactionType(Enum):
     @classmethod
     def type_check_from_string(cls, name: str, transaction_type: str) -> "TransactionType":
         Configuration.type_check_string(name, transaction_type)
-        if not TransactionType.has_value(transaction_type.lower()):
+        result: Optional[TransactionType] = _get_transaction_type_from_string(transaction_type)
+        if result is None:
             raise RP2ValueError(f"Parameter '{name}' has invalid transaction type value: {transaction_type}")
-        return TransactionType[transaction_type.upper()]
+        return result
 
     @classmethod
     def type_check(cls, name: str, transaction_type: "TransactionType") -> "TransactionType":
@@ -87,6 +89,16 @@ _transaction_type_values_to_translation: Dict[TransactionType, str] = {
 }
 
 
+# Input files contain the same few transaction type strings over and over (in various capitalizations), so cache their normalization.
+# lru_cache's typeshed signature contains Any: the ignore is limited to the decorator so the rest of the module stays fully strict.
+@lru_cache(maxsize=256, typed=False)  # type: ignore[misc]
+def _get_transaction_type_from_string(transaction_type: str) -> Optional[TransactionType]:
+    normalized_transaction_type: str = transaction_type.lower()
+    if not TransactionType.has_value(normalized_transaction_type):
+        return None
+    return TransactionType(normalized_transaction_type)
+
+
 class EntrySetType(Enum):
     IN: str = "in"
     INTRA: str = "intra"
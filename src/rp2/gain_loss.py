@@ -24,6 +24,12 @@ from rp2.rp2_error import RP2RuntimeError, RP2TypeError, RP2ValueError
 
 
 class GainLoss(AbstractEntry):
+    __slots__ = (
+        "__taxable_event",
+        "__crypto_amount",
+        "__acquired_lot",
+    )
+
     def __init__(
         self,
         configuration: Configuration,
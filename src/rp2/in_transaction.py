@@ -24,6 +24,18 @@ from rp2.rp2_error import RP2TypeError, RP2ValueError
 
 
 class InTransaction(AbstractTransaction):
+    __slots__ = (
+        "__exchange",
+        "__holder",
+        "__crypto_in",
+        "__crypto_fee",
+        "__fiat_fee",
+        "__from_lot",
+        "__to_lots",
+        "__fiat_in_no_fee",
+        "__fiat_in_with_fee",
+    )
+
     @classmethod
     def type_check(cls, name: str, instance: AbstractEntry) -> "InTransaction":
         Configuration.type_check_parameter_name(name)
@@ -52,6 +64,20 @@ class InTransaction(AbstractTransaction):
     ) -> None:
         super().__init__(configuration, timestamp, asset, transaction_type, spot_price, row, unique_id, notes)
 
+        # Checks that only depend on the superclass fields run first, so invalid input is rejected before any Decimal arithmetic
+        if (
+            self.transaction_type != TransactionType.BUY
+            and self.transaction_type != TransactionType.GIFT
+            and self.transaction_type != TransactionType.DONATE
+            and not self.transaction_type.is_earn_type()
+        ):
+            raise RP2ValueError(
+                f"{self.asset} {type(self).__name__} ({self.timestamp}, id {self.internal_id}): invalid transaction type {self.transaction_type}"
+            )
+
+        if spot_price == ZERO:
+            raise RP2ValueError(f"{self.asset} {type(self).__name__} ({self.timestamp}, id {self.internal_id}): parameter 'spot_price' cannot be 0")
+
         self.__exchange: str = configuration.type_check_exchange("exchange", exchange)
         self.__holder: str = configuration.type_check_holder("holder", holder)
         self.__crypto_in: RP2Decimal
@@ -66,9 +92,6 @@ class InTransaction(AbstractTransaction):
         self.__from_lot: Optional[InTransaction] = InTransaction.type_check("from_lot", from_lot) if from_lot is not None else None
         self.__to_lots: Dict[str, List[InTransaction]] = {}
 
-        if spot_price == ZERO:
-            raise RP2ValueError(f"{self.asset} {type(self).__name__} ({self.timestamp}, id {self.internal_id}): parameter 'spot_price' cannot be 0")
-
         # If fee is paid in crypto then convert it to fiat (it's needed for tax computation), if fee is paid in fiat, then crypto_fee = 0
         # (because no crypto is involved)
         if crypto_fee is not None and fiat_fee is None:
@@ -80,39 +103,32 @@ class InTransaction(AbstractTransaction):
 
         # Fiat in with/without fee are optional. They can be derived from crypto in, spot price and fiat fee, however some exchanges
         # provide them anyway. If they are provided use them as given by the exchange, if not compute them.
+        # The computed values are also used below to cross-check the provided ones, so they are calculated only once.
         self.__fiat_in_no_fee: RP2Decimal
         self.__fiat_in_with_fee: RP2Decimal
+        computed_fiat_in_no_fee: RP2Decimal = self.__crypto_in * self.spot_price
         if fiat_in_no_fee is None:
-            self.__fiat_in_no_fee = self.__crypto_in * self.spot_price
+            self.__fiat_in_no_fee = computed_fiat_in_no_fee
         else:
             self.__fiat_in_no_fee = configuration.type_check_positive_decimal("fiat_in_no_fee", fiat_in_no_fee, non_zero=True)
+        computed_fiat_in_with_fee: RP2Decimal = self.__fiat_in_no_fee + self.__fiat_fee
         if fiat_in_with_fee is None:
-            self.__fiat_in_with_fee = self.__fiat_in_no_fee + self.__fiat_fee
+            self.__fiat_in_with_fee = computed_fiat_in_with_fee
         else:
             self.__fiat_in_with_fee = configuration.type_check_positive_decimal("fiat_in_with_fee", fiat_in_with_fee, non_zero=True)
 
-        if (
-            self.transaction_type != TransactionType.BUY
-            and self.transaction_type != TransactionType.GIFT
-            and self.transaction_type != TransactionType.DONATE
-            and not self.transaction_type.is_earn_type()
-        ):
-            raise RP2ValueError(
-                f"{self.asset} {type(self).__name__} ({self.timestamp}, id {self.internal_id}): invalid transaction type {self.transaction_type}"
-            )
-
-        # If the values provided by the exchange doesn't match the computed one, log a warning.
-        if not RP2Decimal.is_equal_within_precision(self.__crypto_in * self.spot_price, self.__fiat_in_no_fee, FIAT_DECIMAL_MASK):
+        # If the values provided by the exchange doesn't match the computed one, log a warning (computed values match by construction).
+        if fiat_in_no_fee is not None and not RP2Decimal.is_equal_within_precision(computed_fiat_in_no_fee, self.__fiat_in_no_fee, FIAT_DECIMAL_MASK):
             LOGGER.warning(
                 "%s %s (%s, id %s): crypto_in * spot_price != fiat_in_no_fee: %f != %f",
                 self.asset,
                 type(self).__name__,
                 self.timestamp,
                 self.internal_id,
-                self.__crypto_in * self.spot_price,
+                computed_fiat_in_no_fee,
                 self.__fiat_in_no_fee,
             )
-        if not RP2Decimal.is_equal_within_precision(self.__fiat_in_with_fee, self.__fiat_in_no_fee + self.__fiat_fee, FIAT_DECIMAL_MASK):
+        if fiat_in_with_fee is not None and not RP2Decimal.is_equal_within_precision(self.__fiat_in_with_fee, computed_fiat_in_with_fee, FIAT_DECIMAL_MASK):
             LOGGER.warning(
                 "%s %s (%s, id %s): fiat_in_with_fee != fiat_in_no_fee + fiat_fee: %f != %f",
                 self.asset,
@@ -120,7 +136,7 @@ class InTransaction(AbstractTransaction):
                 self.timestamp,
                 self.internal_id,
                 self.__fiat_in_with_fee,
-                self.__fiat_in_no_fee + self.__fiat_fee,
+                computed_fiat_in_with_fee,
             )
 
     def to_string(self, indent: int = 0, repr_format: bool = True, extra_data: Optional[List[str]] = None) -> str:
@@ -129,25 +145,23 @@ class InTransaction(AbstractTransaction):
         if extra_data and not isinstance(extra_data, List):
             raise RP2TypeError(f"Parameter 'extra_data' is not of type List: {extra_data}")
 
-        class_specific_data: List[str] = []
-        stringify: Callable[[object], str] = repr
-        if not repr_format:
-            stringify = str
-        to_lots_string_parts = [f"{exchange}: {', '.join(t.internal_id for t in transactions)}" for exchange, transactions in self.to_lots.items()]
-        class_specific_data = [
-            f"exchange={stringify(self.exchange)}",
-            f"holder={stringify(self.holder)}",
+        stringify: Callable[[object], str] = repr if repr_format else str
+        to_lots_string_parts = [f"{exchange}: {', '.join(t.internal_id for t in transactions)}" for exchange, transactions in self.__to_lots.items()]
+        # Own fields are read from the private attributes directly, skipping property dispatch
+        class_specific_data: List[str] = [
+            f"exchange={stringify(self.__exchange)}",
+            f"holder={stringify(self.__holder)}",
             f"transaction_type={stringify(self.transaction_type)}",
             f"spot_price={self.spot_price:.4f}",
-            f"crypto_in={self.crypto_in:.8f}",
-            f"fiat_fee={self.fiat_fee:.4f}",
-            f"fiat_in_no_fee={self.fiat_in_no_fee:.4f}",
-            f"fiat_in_with_fee={self.fiat_in_with_fee:.4f}",
+            f"crypto_in={self.__crypto_in:.8f}",
+            f"fiat_fee={self.__fiat_fee:.4f}",
+            f"fiat_in_no_fee={self.__fiat_in_no_fee:.4f}",
+            f"fiat_in_with_fee={self.__fiat_in_with_fee:.4f}",
             f"unique_id={self.unique_id}",
             f"is_taxable={stringify(self.is_taxable())}",
             f"fiat_taxable_amount={self.fiat_taxable_amount:.4f}",
-            f"from_lot={self.from_lot.internal_id if self.from_lot is not None else ''}",
-            f"to_lots={', '.join(to_lots_string_parts)}"
+            f"from_lot={self.__from_lot.internal_id if self.__from_lot is not None else ''}",
+            f"to_lots={', '.join(to_lots_string_parts)}",
         ]
         if extra_data:
             class_specific_data.extend(extra_data)
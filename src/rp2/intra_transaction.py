@@ -22,6 +22,17 @@ from rp2.rp2_error import RP2TypeError, RP2ValueError
 
 
 class IntraTransaction(AbstractTransaction):
+    __slots__ = (
+        "__crypto_sent",
+        "__crypto_received",
+        "__crypto_fee",
+        "__from_exchange",
+        "__from_holder",
+        "__to_exchange",
+        "__to_holder",
+        "__fiat_fee",
+    )
+
     def __init__(
         self,
         configuration: Configuration,
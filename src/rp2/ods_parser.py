@@ -12,10 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, get_type_hints
 
 import ezodf
 
@@ -32,6 +31,7 @@ from rp2.rp2_error import RP2Error, RP2RuntimeError, RP2ValueError
 from rp2.transaction_set import TransactionSet
 
 _TABLE_END: str = "TABLE END"
+_TABLE_BEGIN_TYPES: Set[EntrySetType] = {EntrySetType.IN, EntrySetType.OUT, EntrySetType.INTRA}
 
 
 def open_ods(configuration: Configuration, input_file_path: str) -> Any:
@@ -68,6 +68,8 @@ def parse_ods(configuration: Configuration, asset: str, input_file_handle: Any)
     # Artificial internal ids are negative.
     for i, row in enumerate(input_sheet.rows()):
         cell0_value: str = row[0].value
+        # The first cell is checked several times below: classify it only once per row
+        cell0_table_type: Optional[EntrySetType] = _get_table_begin_type(cell0_value)
         # The numeric elements of the row_values list are used to initialize RP2Decimal instances. In theory we could collect string representations
         # from numeric strings using the plaintext() method of Cell, but this doesn't work well because of an ezodf limitation: such strings are
         # affected by the format of their cell (so they may be less precise than their real value, depending on cell format), so as a workaround
@@ -81,7 +83,7 @@ def parse_ods(configuration: Configuration, asset: str, input_file_handle: Any)
 
         if current_table_type is not None:
             # Inside a table
-            if _is_table_begin(cell0_value):
+            if cell0_table_type is not None:
                 # Found a nested table begin
                 raise RP2ValueError(f'{asset}({i + 1}): Found "{cell0_value}" keyword while parsing table {current_table_type}')
             if _is_empty(cell0_value):
@@ -93,14 +95,14 @@ def parse_ods(configuration: Configuration, asset: str, input_file_handle: Any)
             if _is_table_end(cell0_value):
                 # Found a spurious table end
                 raise RP2ValueError(f"{asset}({i + 1}): Found end-table keyword without having found a table-begin keyword first")
-            if not _is_empty(cell0_value) and not _is_table_begin(cell0_value):
+            if not _is_empty(cell0_value) and cell0_table_type is None:
                 # Found a non-empty and non-table-begin cell outside a table
                 raise RP2ValueError(f'{asset}({i + 1}): Found an invalid cell "{cell0_value}" while looking for a table-begin token')
 
-        if _is_table_begin(cell0_value):
+        if cell0_table_type is not None:
             # New table start
             current_table_row_count = 0
-            current_table_type = _get_entry_set_type(cell0_value)
+            current_table_type = cell0_table_type
             if current_table_type and not unfiltered_transaction_sets[current_table_type].is_empty():
                 # Found an already-processed table type
                 raise RP2ValueError(f"{asset}({i + 1}): Found more than one {cell0_value} symbol")
@@ -224,8 +226,8 @@ def _get_decimal_constructor_argument_names(class_name: str) -> List[str]:
     class_to_inspect = globals()[class_name]
     if not issubclass(class_to_inspect, AbstractTransaction):
         raise RP2RuntimeError(f"Internal error: class {class_name} is not a subclass of AbstractTransaction")
-    arg_spec = inspect.getfullargspec(class_to_inspect.__init__)
-    for parameter_name, parameter_type in arg_spec.annotations.items():
+    # get_type_hints() resolves string annotations too: these are what Cython-compiled classes expose (see setup.py)
+    for parameter_name, parameter_type in get_type_hints(class_to_inspect.__init__).items():
         if parameter_type in [RP2Decimal, Optional[RP2Decimal]]:
             result.append(parameter_name)
     return result
@@ -286,24 +288,10 @@ def _create_transaction(
     return transaction
 
 
-def _get_entry_set_type(cell_value: str) -> Optional[EntrySetType]:
-    return EntrySetType.get_entry_set_type_from_string(cell_value)
-
-
-def _is_table_in(cell_value: str) -> bool:
-    return _get_entry_set_type(cell_value) == EntrySetType.IN
-
-
-def _is_table_out(cell_value: str) -> bool:
-    return _get_entry_set_type(cell_value) == EntrySetType.OUT
-
-
-def _is_table_intra(cell_value: str) -> bool:
-    return _get_entry_set_type(cell_value) == EntrySetType.INTRA
-
-
-def _is_table_begin(cell_value: str) -> bool:
-    return _is_table_in(cell_value) or _is_table_out(cell_value) or _is_table_intra(cell_value)
+# Returns the type of table that the cell value begins, or None if the cell value is not a table-begin keyword
+def _get_table_begin_type(cell_value: str) -> Optional[EntrySetType]:
+    entry_set_type: Optional[EntrySetType] = EntrySetType.get_entry_set_type_from_string(cell_value)
+    return entry_set_type if entry_set_type in _TABLE_BEGIN_TYPES else None
 
 
 def _is_table_end(cell_value: str) -> bool:
@@ -24,6 +24,17 @@ from rp2.rp2_error import RP2TypeError, RP2ValueError
 
 # pylint: disable=too-many-branches
 class OutTransaction(AbstractTransaction):
+    __slots__ = (
+        "__exchange",
+        "__holder",
+        "__crypto_out_no_fee",
+        "__crypto_fee",
+        "__fiat_out_with_fee",
+        "__fiat_out_no_fee",
+        "__crypto_out_with_fee",
+        "__fiat_fee",
+    )
+
     def __init__(
         self,
         configuration: Configuration,
@@ -0,0 +1,25 @@
+# Copyright 2021 eprbell
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import lru_cache
+
+from rp2.configuration import Configuration
+from rp2.plugin.country.us import US
+
+
+# Parsing the configuration file is the same for every test module that builds transactions by hand, so do it only once per process.
+# Modules that parse ODS input must not use this: the parser draws artificial ids from the configuration, so it must not be shared.
+@lru_cache(maxsize=None, typed=False)
+def get_test_data_configuration() -> Configuration:
+    return Configuration("./config/test_data.ini", US())
@@ -18,13 +18,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List
 
+from rp2_test_configuration import get_test_data_configuration
+
 from rp2.abstract_accounting_method import AbstractAccountingMethod
 from rp2.configuration import Configuration
 from rp2.plugin.accounting_method.fifo import AccountingMethod as AccountingMethodFIFO
 from rp2.plugin.accounting_method.lifo import AccountingMethod as AccountingMethodLIFO
 from rp2.plugin.accounting_method.hifo import AccountingMethod as AccountingMethodHIFO
 from rp2.plugin.accounting_method.lofo import AccountingMethod as AccountingMethodLOFO
-from rp2.plugin.country.us import US
 from rp2.rp2_decimal import RP2Decimal
 from rp2.in_transaction import InTransaction
 
@@ -46,7 +47,7 @@ class TestAccountingMethod(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        TestAccountingMethod._configuration = Configuration("./config/test_data.ini", US())
+        TestAccountingMethod._configuration = get_test_data_configuration()
 
     def setUp(self) -> None:
         self.maxDiff = None  # pylint: disable=invalid-name
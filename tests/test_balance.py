@@ -15,12 +15,13 @@
 import unittest
 from datetime import date
 
+from rp2_test_configuration import get_test_data_configuration
+
 from rp2.balance import BalanceSet
 from rp2.configuration import Configuration
 from rp2.in_transaction import InTransaction
 from rp2.input_data import InputData
 from rp2.out_transaction import OutTransaction
-from rp2.plugin.country.us import US
 from rp2.rp2_decimal import RP2Decimal
 from rp2.rp2_error import RP2ValueError
 from rp2.transaction_set import TransactionSet
@@ -31,7 +32,7 @@ class TestBalanceSet(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        TestBalanceSet._configuration = Configuration("./config/test_data.ini", US())
+        TestBalanceSet._configuration = get_test_data_configuration()
 
     def setUp(self) -> None:
         self.maxDiff = None  # pylint: disable=invalid-name
@@ -19,6 +19,7 @@ from datetime import datetime
 from tempfile import NamedTemporaryFile
 from typing import Optional
 
+from dateutil.parser import parse
 from dateutil.tz import tzoffset, tzutc
 
 from rp2.abstract_country import AbstractCountry
@@ -458,6 +459,27 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(0, date.microsecond)
         self.assertEqual(tzoffset(None, -14400), date.tzinfo)
 
+        # Common timestamp shapes are parsed without dateutil: results must match dateutil's, including the tzinfo class
+        for timestamp in [
+            "2021-01-02T08:42:43.882Z",
+            "2020-04-01T09:45Z",
+            "2020-01-01 08:41:00.000000 +0000",
+            "2021-01-02T08:42:43-05:30",
+            "2021-01-02 08:42:43.5 +0530",
+            "2021-01-02T08:42:43-00:00",
+        ]:
+            with self.subTest(timestamp=timestamp):
+                date = self._configuration.type_check_timestamp_from_string("timestamp", timestamp)
+                expected: datetime = parse(timestamp)
+                self.assertEqual(expected.replace(tzinfo=None), date.replace(tzinfo=None))
+                self.assertEqual(expected.utcoffset(), date.utcoffset())
+                self.assertEqual(repr(expected.tzinfo), repr(date.tzinfo))
+
+        # Shapes that datetime.fromisoformat() accepts but dateutil doesn't must still be rejected
+        for timestamp in ["2021-01-02X08:42:43+00:00", "2021-01-02T08:42:43+05:30:15", "2021-W01-1T00:00:00Z"]:
+            with self.subTest(timestamp=timestamp), self.assertRaisesRegex(RP2ValueError, "Unknown string format: .*"):
+                self._configuration.type_check_timestamp_from_string("timestamp", timestamp)
+
         with self.assertRaisesRegex(RP2TypeError, "Parameter name is not a string: .*"):
             self._configuration.type_check_timestamp_from_string(12, "2020-12-01 03:59:49 -04:00")  # type: ignore
         with self.assertRaisesRegex(RP2TypeError, "Parameter 'timestamp' has non-string value .*"):
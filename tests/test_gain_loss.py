@@ -14,12 +14,13 @@
 
 import unittest
 
+from rp2_test_configuration import get_test_data_configuration
+
 from rp2.configuration import Configuration
 from rp2.gain_loss import GainLoss
 from rp2.in_transaction import InTransaction
 from rp2.intra_transaction import IntraTransaction
 from rp2.out_transaction import OutTransaction
-from rp2.plugin.country.us import US
 from rp2.rp2_decimal import RP2Decimal
 from rp2.rp2_error import RP2TypeError, RP2ValueError
 
@@ -30,7 +31,7 @@ class TestGainLoss(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls._configuration = Configuration("./config/test_data.ini", US())
+        cls._configuration = get_test_data_configuration()
 
     def setUp(self) -> None:
         self.maxDiff = None  # pylint: disable=invalid-name
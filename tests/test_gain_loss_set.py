@@ -15,6 +15,7 @@
 import unittest
 from typing import Dict, List
 
+from rp2_test_configuration import get_test_data_configuration
 from rp2_test_output import RP2_TEST_OUTPUT
 
 from rp2.configuration import Configuration
@@ -23,7 +24,6 @@ from rp2.gain_loss_set import GainLossSet
 from rp2.in_transaction import InTransaction
 from rp2.intra_transaction import IntraTransaction
 from rp2.out_transaction import OutTransaction
-from rp2.plugin.country.us import US
 from rp2.rp2_decimal import RP2Decimal
 from rp2.rp2_error import RP2TypeError, RP2ValueError
 
@@ -56,7 +56,7 @@ class TestGainLossSet(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls._configuration = Configuration("./config/test_data.ini", US())
+        cls._configuration = get_test_data_configuration()
 
         cls._in3 = {}
         cls._in2 = {}
@@ -14,24 +14,166 @@
 
 import re
 import unittest
+from typing import Any, Dict, List, Pattern, Tuple, Type
 
 from dateutil.tz import tzutc
+from rp2_test_configuration import get_test_data_configuration
 
 from rp2.configuration import Configuration
 from rp2.entry_types import TransactionType
 from rp2.in_transaction import InTransaction
+from rp2.logger import LOGGER
 from rp2.out_transaction import OutTransaction
-from rp2.plugin.country.us import US
-from rp2.rp2_decimal import RP2Decimal
+from rp2.rp2_decimal import ZERO, RP2Decimal
 from rp2.rp2_error import RP2TypeError, RP2ValueError
 
+_D_1000 = RP2Decimal("1000")
+_D_1000_0 = RP2Decimal("1000.0")
+_D_2_0002 = RP2Decimal("2.0002")
+_D_18 = RP2Decimal("18")
+_D_20 = RP2Decimal("20")
+_D_1900_2 = RP2Decimal("1900.2")
+_D_2000_2 = RP2Decimal("2000.2")
+_D_2020_2 = RP2Decimal("2020.2")
+_D_NEG_1000 = RP2Decimal("-1000")
+_D_NEG_2_0002 = RP2Decimal("-2.0002")
+_D_NEG_20 = RP2Decimal("-20")
+_D_NEG_2000_2 = RP2Decimal("-2000.2")
+_D_NEG_2020_2 = RP2Decimal("-2020.2")
+_D_TINY = RP2Decimal("0.00000000000001")
+_BAD_NOTES_LIST: List[int] = [1, 2, 3]
+
+_PARAMETER_NAME_RE = re.compile(r"Parameter name is not a string: .*")
+_TRANSACTION_TYPE_NON_STRING_RE = re.compile(r"Parameter 'transaction_type' has non-string value .*")
+_TRANSACTION_TYPE_INVALID_RE = re.compile(r"Parameter 'transaction_type' has invalid transaction type value: .*")
+_INDENT_NON_INTEGER_RE = re.compile(r"Parameter 'indent' has non-integer value")
+_INDENT_NON_POSITIVE_RE = re.compile(r"Parameter 'indent' has non-positive value.*")
+_REPR_FORMAT_NON_BOOL_RE = re.compile(r"Parameter 'repr_format' has non-bool value .*")
+_EXTRA_DATA_NON_LIST_RE = re.compile(r"Parameter 'extra_data' is not of type List")
+_NOT_IN_TRANSACTION_RE = re.compile(r"Parameter 'my_instance' is not of type InTransaction:.*")
+_OUT_TRANSACTION_NOT_IN_TRANSACTION_RE = re.compile(r"Parameter 'my_instance' is not of type InTransaction: OutTransaction")
+_CONFIGURATION_RE = re.compile(r"Parameter 'configuration' is not of type Configuration: .*")
+_ROW_NON_INTEGER_RE = re.compile(r"Parameter 'row' has non-integer .*")
+_TIMESTAMP_UNKNOWN_FORMAT_RE = re.compile(r"Error parsing parameter 'timestamp': Unknown string format: .*")
+_TIMESTAMP_NO_TIMEZONE_RE = re.compile(r"Parameter 'timestamp' value has no timezone info: .*")
+_TIMESTAMP_NON_STRING_RE = re.compile(r"Parameter 'timestamp' has non-string value .*")
+_ASSET_UNKNOWN_RE = re.compile(r"Parameter 'asset' value is not known: .*")
+_ASSET_NON_STRING_RE = re.compile(r"Parameter 'asset' has non-string value .*")
+_EXCHANGE_UNKNOWN_RE = re.compile(r"Parameter 'exchange' value is not known: .*")
+_EXCHANGE_NON_STRING_RE = re.compile(r"Parameter 'exchange' has non-string value .*")
+_HOLDER_UNKNOWN_RE = re.compile(r"Parameter 'holder' value is not known: .*")
+_HOLDER_NON_STRING_RE = re.compile(r"Parameter 'holder' has non-string value .*")
+_NOTES_NON_STRING_RE = re.compile(r"Parameter 'notes' has non-string value ")
+_IN_TRANSACTION_TYPE_RE = re.compile(r".*InTransaction .*, id.*invalid transaction type.*")
+_SPOT_PRICE_ZERO_RE = re.compile(r".*InTransaction .*, id.*parameter 'spot_price' cannot be 0")
+_SPOT_PRICE_NON_POSITIVE_RE = re.compile(r"Parameter 'spot_price' has non-positive value .*")
+_SPOT_PRICE_NON_DECIMAL_RE = re.compile(r"Parameter 'spot_price' has non-RP2Decimal value .*")
+_CRYPTO_IN_ZERO_RE = re.compile(r"Parameter 'crypto_in' has zero value")
+_CRYPTO_IN_NON_POSITIVE_RE = re.compile(r"Parameter 'crypto_in' has non-positive value .*")
+_CRYPTO_IN_NON_DECIMAL_RE = re.compile(r"Parameter 'crypto_in' has non-RP2Decimal value .*")
+_FIAT_FEE_NON_POSITIVE_RE = re.compile(r"Parameter 'fiat_fee' has non-positive value .*")
+_FIAT_FEE_NON_DECIMAL_RE = re.compile(r"Parameter 'fiat_fee' has non-RP2Decimal value .*")
+_FIAT_IN_NO_FEE_NON_POSITIVE_RE = re.compile(r"Parameter 'fiat_in_no_fee' has non-positive value .*")
+_FIAT_IN_NO_FEE_NON_DECIMAL_RE = re.compile(r"Parameter 'fiat_in_no_fee' has non-RP2Decimal value .*")
+_FIAT_IN_WITH_FEE_NON_POSITIVE_RE = re.compile(r"Parameter 'fiat_in_with_fee' has non-positive value .*")
+_FIAT_IN_WITH_FEE_NON_DECIMAL_RE = re.compile(r"Parameter 'fiat_in_with_fee' has non-RP2Decimal value .*")
+_BOTH_FEES_RE = re.compile(r"both 'crypto_fee' and 'fiat_fee' are defined: only one allowed")
+
+
+_TAXABLE_IN_TRANSACTION_STRING = """InTransaction:
+  id=19
+  timestamp=2021-01-02 08:42:43.882000 +0000
+  asset=B1
+  exchange=BlockFi
+  holder=Bob
+  transaction_type=TransactionType.INTEREST
+  spot_price=1000.0000
+  crypto_in=2.00020000
+  fiat_fee=0.0000
+  fiat_in_no_fee=2000.2000
+  fiat_in_with_fee=2000.2000
+  unique_id=
+  is_taxable=True
+  fiat_taxable_amount=2000.2000
+  from_lot=
+  to_lots="""
+# to_string(2, repr_format=False, ...) indents every line of the str() form by two levels and appends extra_data as further fields
+_TAXABLE_IN_TRANSACTION_INDENTED_STRING = "\n".join([f"    {line}" for line in _TAXABLE_IN_TRANSACTION_STRING.splitlines()] + ["      foobar", "      qwerty"])
+_TAXABLE_IN_TRANSACTION_REPR_STRING = (
+    "    InTransaction("
+    "id='19', "
+    "timestamp='2021-01-02 08:42:43.882000 +0000', "
+    "asset='B1', "
+    "exchange='BlockFi', "
+    "holder='Bob', "
+    "transaction_type=<TransactionType.INTEREST: 'interest'>, "
+    "spot_price=1000.0000, "
+    "crypto_in=2.00020000, "
+    "fiat_fee=0.0000, "
+    "fiat_in_no_fee=2000.2000, "
+    "fiat_in_with_fee=2000.2000, "
+    "unique_id=, "
+    "is_taxable=True, "
+    "fiat_taxable_amount=2000.2000, "
+    "from_lot=, "
+    "to_lots=, "
+    "foobar, "
+    "qwerty)"
+)
+
 
 class TestInTransaction(unittest.TestCase):
     _configuration: Configuration
+    _canonical_in_transaction: InTransaction
+    _sample_out_transaction: OutTransaction
+    _base_arguments: Dict[str, Any]
 
     @classmethod
     def setUpClass(cls) -> None:
-        TestInTransaction._configuration = Configuration("./config/test_data.ini", US())
+        TestInTransaction._configuration = get_test_data_configuration()
+        # Read-only tests share this instance, so it's built (and its timestamp parsed) only once
+        TestInTransaction._canonical_in_transaction = InTransaction(
+            TestInTransaction._configuration,
+            "2021-01-02T08:42:43.882Z",
+            "B1",
+            "BlockFi",
+            "Bob",
+            "inTerest",
+            _D_1000_0,
+            _D_2_0002,
+            fiat_fee=ZERO,
+            fiat_in_no_fee=_D_2000_2,
+            fiat_in_with_fee=_D_2000_2,
+            row=19,
+        )
+        # Only used to check that InTransaction.type_check() rejects other transaction classes
+        TestInTransaction._sample_out_transaction = OutTransaction(
+            TestInTransaction._configuration,
+            "2021-01-12T11:51:38Z",
+            "B1",
+            "BlockFi",
+            "Bob",
+            "SELL",
+            RP2Decimal("10000"),
+            RP2Decimal("1"),
+            ZERO,
+            row=45,
+        )
+        # Valid InTransaction constructor arguments: each bad-argument case overrides some of them
+        TestInTransaction._base_arguments = {
+            "configuration": TestInTransaction._configuration,
+            "timestamp": "2021-01-02T08:42:43.882Z",
+            "asset": "B1",
+            "exchange": "BlockFi",
+            "holder": "Bob",
+            "transaction_type": "interest",
+            "spot_price": _D_1000,
+            "crypto_in": _D_2_0002,
+            "fiat_fee": _D_20,
+            "fiat_in_no_fee": _D_2000_2,
+            "fiat_in_with_fee": _D_2020_2,
+            "row": 19,
+        }
 
     def setUp(self) -> None:
         self.maxDiff = None  # pylint: disable=invalid-name
@@ -49,34 +191,21 @@ class TestInTransaction(unittest.TestCase):
         self.assertEqual(TransactionType.STAKING, TransactionType.type_check_from_string("transaction_type", "sTaKING"))
         self.assertEqual(TransactionType.WAGES, TransactionType.type_check_from_string("transaction_type", "WageS"))
 
-        with self.assertRaisesRegex(RP2TypeError, "Parameter name is not a string: .*"):
+        with self.assertRaisesRegex(RP2TypeError, _PARAMETER_NAME_RE):
             TransactionType.type_check_from_string(12, "buy")  # type: ignore
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'transaction_type' has non-string value .*"):
+        with self.assertRaisesRegex(RP2TypeError, _TRANSACTION_TYPE_NON_STRING_RE):
             TransactionType.type_check_from_string("transaction_type", 34.6)  # type: ignore
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'transaction_type' has non-string value .*"):
+        with self.assertRaisesRegex(RP2TypeError, _TRANSACTION_TYPE_NON_STRING_RE):
             TransactionType.type_check_from_string("transaction_type", None)  # type: ignore
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'transaction_type' has invalid transaction type value: .*"):
+        with self.assertRaisesRegex(RP2ValueError, _TRANSACTION_TYPE_INVALID_RE):
             TransactionType.type_check_from_string("transaction_type", "Cook")
 
     def test_taxable_in_transaction(self) -> None:
-        in_transaction: InTransaction = InTransaction(
-            self._configuration,
-            "2021-01-02T08:42:43.882Z",
-            "B1",
-            "BlockFi",
-            "Bob",
-            "inTerest",
-            RP2Decimal("1000.0"),
-            RP2Decimal("2.0002"),
-            fiat_fee=RP2Decimal("0"),
-            fiat_in_no_fee=RP2Decimal("2000.2"),
-            fiat_in_with_fee=RP2Decimal("2000.2"),
-            row=19,
-        )
+        in_transaction: InTransaction = self._canonical_in_transaction
 
         InTransaction.type_check("my_instance", in_transaction)
         self.assertTrue(in_transaction.is_taxable())
-        self.assertEqual(RP2Decimal("2000.2"), in_transaction.fiat_taxable_amount)
+        self.assertEqual(_D_2000_2, in_transaction.fiat_taxable_amount)
         self.assertEqual("19", in_transaction.internal_id)
         self.assertEqual(19, in_transaction.row)
         self.assertEqual(2021, in_transaction.timestamp.year)
@@ -91,80 +220,17 @@ class TestInTransaction(unittest.TestCase):
         self.assertEqual("BlockFi", in_transaction.exchange)
         self.assertEqual("Bob", in_transaction.holder)
         self.assertEqual(TransactionType.INTEREST, in_transaction.transaction_type)
-        self.assertEqual(RP2Decimal("1000"), in_transaction.spot_price)
-        self.assertEqual(RP2Decimal("2.0002"), in_transaction.crypto_in)
-        self.assertEqual(RP2Decimal("2000.2"), in_transaction.fiat_in_no_fee)
-        self.assertEqual(RP2Decimal("2000.2"), in_transaction.fiat_in_with_fee)
-        self.assertEqual(RP2Decimal("0"), in_transaction.fiat_fee)
-        self.assertEqual(RP2Decimal("2.0002"), in_transaction.crypto_balance_change)
-        self.assertEqual(RP2Decimal("2000.2"), in_transaction.fiat_balance_change)
+        self.assertEqual(_D_1000, in_transaction.spot_price)
+        self.assertEqual(_D_2_0002, in_transaction.crypto_in)
+        self.assertEqual(_D_2000_2, in_transaction.fiat_in_no_fee)
+        self.assertEqual(_D_2000_2, in_transaction.fiat_in_with_fee)
+        self.assertEqual(ZERO, in_transaction.fiat_fee)
+        self.assertEqual(_D_2_0002, in_transaction.crypto_balance_change)
+        self.assertEqual(_D_2000_2, in_transaction.fiat_balance_change)
 
-        self.assertEqual(
-            str(in_transaction),
-            """InTransaction:
-  id=19
-  timestamp=2021-01-02 08:42:43.882000 +0000
-  asset=B1
-  exchange=BlockFi
-  holder=Bob
-  transaction_type=TransactionType.INTEREST
-  spot_price=1000.0000
-  crypto_in=2.00020000
-  fiat_fee=0.0000
-  fiat_in_no_fee=2000.2000
-  fiat_in_with_fee=2000.2000
-  unique_id=
-  is_taxable=True
-  fiat_taxable_amount=2000.2000
-  from_lot=
-  to_lots=""",
-        )
-        self.assertEqual(
-            in_transaction.to_string(2, repr_format=False, extra_data=["foobar", "qwerty"]),
-            """    InTransaction:
-      id=19
-      timestamp=2021-01-02 08:42:43.882000 +0000
-      asset=B1
-      exchange=BlockFi
-      holder=Bob
-      transaction_type=TransactionType.INTEREST
-      spot_price=1000.0000
-      crypto_in=2.00020000
-      fiat_fee=0.0000
-      fiat_in_no_fee=2000.2000
-      fiat_in_with_fee=2000.2000
-      unique_id=
-      is_taxable=True
-      fiat_taxable_amount=2000.2000
-      from_lot=
-      to_lots=
-      foobar
-      qwerty""",
-        )
-        self.assertEqual(
-            in_transaction.to_string(2, repr_format=True, extra_data=["foobar", "qwerty"]),
-            (
-                "    InTransaction("
-                "id='19', "
-                "timestamp='2021-01-02 08:42:43.882000 +0000', "
-                "asset='B1', "
-                "exchange='BlockFi', "
-                "holder='Bob', "
-                "transaction_type=<TransactionType.INTEREST: 'interest'>, "
-                "spot_price=1000.0000, "
-                "crypto_in=2.00020000, "
-                "fiat_fee=0.0000, "
-                "fiat_in_no_fee=2000.2000, "
-                "fiat_in_with_fee=2000.2000, "
-                "unique_id=, "
-                "is_taxable=True, "
-                "fiat_taxable_amount=2000.2000, "
-                "from_lot=, "
-                "to_lots=, "
-                "foobar, "
-                "qwerty)"
-            ),
-        )
+        self.assertEqual(str(in_transaction), _TAXABLE_IN_TRANSACTION_STRING)
+        self.assertEqual(in_transaction.to_string(2, repr_format=False, extra_data=["foobar", "qwerty"]), _TAXABLE_IN_TRANSACTION_INDENTED_STRING)
+        self.assertEqual(in_transaction.to_string(2, repr_format=True, extra_data=["foobar", "qwerty"]), _TAXABLE_IN_TRANSACTION_REPR_STRING)
 
     def test_non_taxable_in_transaction(self) -> None:
         in_transaction = InTransaction(
@@ -174,17 +240,17 @@ class TestInTransaction(unittest.TestCase):
             "Coinbase",
             "Alice",
             "BuY",
-            RP2Decimal("1000"),
-            RP2Decimal("2.0002"),
-            fiat_fee=RP2Decimal("20"),
+            _D_1000,
+            _D_2_0002,
+            fiat_fee=_D_20,
             row=19,
         )
         self.assertFalse(in_transaction.is_taxable())
-        self.assertEqual(RP2Decimal("0"), in_transaction.fiat_taxable_amount)
+        self.assertEqual(ZERO, in_transaction.fiat_taxable_amount)
         self.assertEqual("B2", in_transaction.asset)
         self.assertEqual(TransactionType.BUY, in_transaction.transaction_type)
-        self.assertEqual(RP2Decimal("2.0002"), in_transaction.crypto_balance_change)
-        self.assertEqual(RP2Decimal("2020.2"), in_transaction.fiat_balance_change)
+        self.assertEqual(_D_2_0002, in_transaction.crypto_balance_change)
+        self.assertEqual(_D_2020_2, in_transaction.fiat_balance_change)
 
         self.assertEqual(
             str(in_transaction),
@@ -215,11 +281,11 @@ class TestInTransaction(unittest.TestCase):
             "BlockFi",
             "Bob",
             "iNtErEsT",
-            RP2Decimal("1000.0"),
-            RP2Decimal("2.0002"),
-            fiat_fee=RP2Decimal("0"),
-            fiat_in_no_fee=RP2Decimal("2000.2"),
-            fiat_in_with_fee=RP2Decimal("2000.2"),
+            _D_1000_0,
+            _D_2_0002,
+            fiat_fee=ZERO,
+            fiat_in_no_fee=_D_2000_2,
+            fiat_in_with_fee=_D_2000_2,
             row=19,
         )
         in_transaction2: InTransaction = InTransaction(
@@ -229,11 +295,11 @@ class TestInTransaction(unittest.TestCase):
             "BlockFi",
             "Bob",
             "INTEReST",
-            RP2Decimal("1000.0"),
-            RP2Decimal("2.0002"),
-            fiat_fee=RP2Decimal("0"),
-            fiat_in_no_fee=RP2Decimal("2000.2"),
-            fiat_in_with_fee=RP2Decimal("2000.2"),
+            _D_1000_0,
+            _D_2_0002,
+            fiat_fee=ZERO,
+            fiat_in_no_fee=_D_2000_2,
+            fiat_in_with_fee=_D_2000_2,
             row=19,
         )
         in_transaction3: InTransaction = InTransaction(
@@ -243,11 +309,11 @@ class TestInTransaction(unittest.TestCase):
             "BlockFi",
             "Bob",
             "interest",
-            RP2Decimal("1000.0"),
-            RP2Decimal("2.0002"),
-            fiat_fee=RP2Decimal("0"),
-            fiat_in_no_fee=RP2Decimal("2000.2"),
-            fiat_in_with_fee=RP2Decimal("2000.2"),
+            _D_1000_0,
+            _D_2_0002,
+            fiat_fee=ZERO,
+            fiat_in_no_fee=_D_2000_2,
+            fiat_in_with_fee=_D_2000_2,
             row=20,
         )
         self.assertEqual(in_transaction, in_transaction)
@@ -259,601 +325,133 @@ class TestInTransaction(unittest.TestCase):
         self.assertNotEqual(hash(in_transaction), hash(in_transaction3))
 
     def test_bad_to_string(self) -> None:
-        in_transaction: InTransaction = InTransaction(
-            self._configuration,
-            "2021-01-02T08:42:43.882Z",
-            "B1",
-            "BlockFi",
-            "Bob",
-            "INteREst",
-            RP2Decimal("1000.0"),
-            RP2Decimal("2.0002"),
-            fiat_fee=RP2Decimal("0"),
-            fiat_in_no_fee=RP2Decimal("2000.2"),
-            fiat_in_with_fee=RP2Decimal("2000.2"),
-            row=19,
-        )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'indent' has non-integer value"):
+        in_transaction: InTransaction = self._canonical_in_transaction
+        with self.assertRaisesRegex(RP2TypeError, _INDENT_NON_INTEGER_RE):
             in_transaction.to_string(None, repr_format=False, extra_data=["foobar", "qwerty"])  # type: ignore
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'indent' has non-positive value.*"):
+        with self.assertRaisesRegex(RP2ValueError, _INDENT_NON_POSITIVE_RE):
             in_transaction.to_string(-1, repr_format=False, extra_data=["foobar", "qwerty"])
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'repr_format' has non-bool value .*"):
+        with self.assertRaisesRegex(RP2TypeError, _REPR_FORMAT_NON_BOOL_RE):
             in_transaction.to_string(1, repr_format="False", extra_data=["foobar", "qwerty"])  # type: ignore
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'extra_data' is not of type List"):
+        with self.assertRaisesRegex(RP2TypeError, _EXTRA_DATA_NON_LIST_RE):
             in_transaction.to_string(1, repr_format=False, extra_data="foobar")  # type: ignore
 
+    def _assert_bad(self, exception_type: Type[Exception], pattern: Pattern[str], **overrides: Any) -> None:
+        with self.assertRaisesRegex(exception_type, pattern):
+            InTransaction(**{**self._base_arguments, **overrides})
+
+    def _check_bad_arguments(self, bad_cases: List[Tuple[Dict[str, Any], Type[Exception], Pattern[str]]]) -> None:
+        for overrides, exception_type, pattern in bad_cases:
+            with self.subTest(overrides=overrides):
+                self._assert_bad(exception_type, pattern, **overrides)
+
+    def test_bad_in_transaction_configuration_and_row(self) -> None:
+        self._check_bad_arguments(
+            [
+                # Bad configuration
+                ({"configuration": None}, RP2TypeError, _CONFIGURATION_RE),
+                ({"configuration": "config"}, RP2TypeError, _CONFIGURATION_RE),
+                # Bad row
+                ({"row": "19"}, RP2TypeError, _ROW_NON_INTEGER_RE),
+            ]
+        )
+
+    def test_bad_in_transaction_timestamp(self) -> None:
+        self._check_bad_arguments(
+            [
+                # Bad timestamp
+                ({"timestamp": "abcdefg"}, RP2ValueError, _TIMESTAMP_UNKNOWN_FORMAT_RE),
+                ({"timestamp": "2021-01-02T08:42:43"}, RP2ValueError, _TIMESTAMP_NO_TIMEZONE_RE),
+                ({"timestamp": 1111}, RP2TypeError, _TIMESTAMP_NON_STRING_RE),
+            ]
+        )
+
+    def test_bad_in_transaction_asset_exchange_holder(self) -> None:
+        self._check_bad_arguments(
+            [
+                # Bad asset
+                ({"asset": "yyy"}, RP2ValueError, _ASSET_UNKNOWN_RE),
+                ({"asset": 1111}, RP2TypeError, _ASSET_NON_STRING_RE),
+                # Bad exchange
+                ({"exchange": "blockfi"}, RP2ValueError, _EXCHANGE_UNKNOWN_RE),
+                ({"exchange": 1111}, RP2TypeError, _EXCHANGE_NON_STRING_RE),
+                # Bad holder
+                ({"holder": "qwerty"}, RP2ValueError, _HOLDER_UNKNOWN_RE),
+                ({"holder": 1111}, RP2TypeError, _HOLDER_NON_STRING_RE),
+            ]
+        )
+
+    def test_bad_in_transaction_transaction_type(self) -> None:
+        self._check_bad_arguments(
+            [
+                # Bad transaction type
+                ({"transaction_type": "seLl"}, RP2ValueError, _IN_TRANSACTION_TYPE_RE),
+                ({"transaction_type": ""}, RP2ValueError, _TRANSACTION_TYPE_INVALID_RE),
+                ({"transaction_type": "cook"}, RP2ValueError, _TRANSACTION_TYPE_INVALID_RE),
+                ({"transaction_type": 1111}, RP2TypeError, _TRANSACTION_TYPE_NON_STRING_RE),
+            ]
+        )
+
+    def test_bad_in_transaction_spot_price_and_crypto_in(self) -> None:
+        self._check_bad_arguments(
+            [
+                # Bad spot price
+                ({"spot_price": ZERO}, RP2ValueError, _SPOT_PRICE_ZERO_RE),
+                ({"spot_price": _D_TINY}, RP2ValueError, _SPOT_PRICE_ZERO_RE),
+                ({"spot_price": _D_NEG_1000}, RP2ValueError, _SPOT_PRICE_NON_POSITIVE_RE),
+                ({"spot_price": "1000"}, RP2TypeError, _SPOT_PRICE_NON_DECIMAL_RE),
+                # Bad crypto in
+                ({"crypto_in": ZERO}, RP2ValueError, _CRYPTO_IN_ZERO_RE),
+                ({"crypto_in": _D_NEG_2_0002}, RP2ValueError, _CRYPTO_IN_NON_POSITIVE_RE),
+                ({"crypto_in": "2.0002"}, RP2TypeError, _CRYPTO_IN_NON_DECIMAL_RE),
+            ]
+        )
+
+    def test_bad_in_transaction_fees(self) -> None:
+        self._check_bad_arguments(
+            [
+                # Bad fiat fee
+                ({"fiat_fee": _D_NEG_20}, RP2ValueError, _FIAT_FEE_NON_POSITIVE_RE),
+                ({"fiat_fee": "20"}, RP2TypeError, _FIAT_FEE_NON_DECIMAL_RE),
+                # Bad fiat in no fee
+                ({"fiat_in_no_fee": _D_NEG_2000_2}, RP2ValueError, _FIAT_IN_NO_FEE_NON_POSITIVE_RE),
+                ({"fiat_in_no_fee": "2000.2"}, RP2TypeError, _FIAT_IN_NO_FEE_NON_DECIMAL_RE),
+                # Bad fiat in with fee
+                ({"fiat_in_with_fee": _D_NEG_2020_2}, RP2ValueError, _FIAT_IN_WITH_FEE_NON_POSITIVE_RE),
+                ({"fiat_in_with_fee": (1, 2, 3)}, RP2TypeError, _FIAT_IN_WITH_FEE_NON_DECIMAL_RE),
+                # Both crypto fee and fiat fee
+                ({"crypto_fee": RP2Decimal("0.02")}, RP2ValueError, _BOTH_FEES_RE),
+            ]
+        )
+
     def test_bad_in_transaction(self) -> None:
-        with self.assertRaisesRegex(RP2TypeError, "Parameter name is not a string:.*"):
+        with self.assertRaisesRegex(RP2TypeError, _PARAMETER_NAME_RE):
             InTransaction.type_check(None, None)  # type: ignore
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'my_instance' is not of type InTransaction:.*"):
+        with self.assertRaisesRegex(RP2TypeError, _NOT_IN_TRANSACTION_RE):
             InTransaction.type_check("my_instance", None)  # type: ignore
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'my_instance' is not of type InTransaction: OutTransaction"):
-            InTransaction.type_check(
-                "my_instance",
-                OutTransaction(
-                    self._configuration,
-                    "2021-01-12T11:51:38Z",
-                    "B1",
-                    "BlockFi",
-                    "Bob",
-                    "SELL",
-                    RP2Decimal("10000"),
-                    RP2Decimal("1"),
-                    RP2Decimal("0"),
-                    row=45,
-                ),
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'configuration' is not of type Configuration: .*"):
-            # Bad configuration
-            InTransaction(
-                None,  # type: ignore
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "interest",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'configuration' is not of type Configuration: .*"):
-            # Bad configuration
-            InTransaction(
-                "config",  # type: ignore
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTEREST",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'row' has non-integer .*"):
-            # Bad row
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "buy",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row="19",  # type: ignore
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Error parsing parameter 'timestamp': Unknown string format: .*"):
-            # Bad timestamp
-            InTransaction(
-                self._configuration,
-                "abcdefg",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "BUY",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'timestamp' value has no timezone info: .*"):
-            # Bad timestamp
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "intErest",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'timestamp' has non-string value .*"):
-            # Bad timestamp
-            InTransaction(
-                self._configuration,
-                1111,  # type: ignore
-                "B1",
-                "BlockFi",
-                "Bob",
-                "intERest",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'asset' value is not known: .*"):
-            # Bad asset
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "yyy",
-                "BlockFi",
-                "Bob",
-                "intEResT",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'asset' has non-string value .*"):
-            # Bad asset
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                1111,  # type: ignore
-                "BlockFi",
-                "Bob",
-                "IntEResT",
-                RP2Decimal("1000.0"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'exchange' value is not known: .*"):
-            # Bad exchange
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "blockfi",
-                "Bob",
-                "INtEResT",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'exchange' has non-string value .*"):
-            # Bad exchange
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                1111,  # type: ignore
-                "Bob",
-                "INtEresT",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'holder' value is not known: .*"):
-            # Bad holder
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "qwerty",
-                "INTEresT",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'holder' has non-string value .*"):
-            # Bad holder
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                1111,  # type: ignore
-                "iNTEresT",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, ".*InTransaction .*, id.*invalid transaction type.*"):
-            # Bad transaction type
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "seLl",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'transaction_type' has invalid transaction type value: .*"):
-            # Bad transaction type
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter .* has invalid transaction type value: .*"):
-            # Bad transaction type
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "cook",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter .* has non-string value .*"):
-            # Bad transaction type
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                1111,  # type: ignore
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, ".*InTransaction .*, id.*parameter 'spot_price' cannot be 0"):
-            # Bad spot price
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "iNTErest",
-                RP2Decimal("0"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, ".*InTransaction .*, id.*parameter 'spot_price' cannot be 0"):
-            # Bad spot price
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "iNTerest",
-                RP2Decimal("0.00000000000001"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'spot_price' has non-positive value .*"):
-            # Bad spot price
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "iNterest",
-                RP2Decimal("-1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'spot_price' has non-RP2Decimal value .*"):
-            # Bad spot price
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "iNtereSt",
-                "1000",  # type: ignore
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'crypto_in' has zero value"):
-            # Bad crypto in
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "intereSt",
-                RP2Decimal("1000"),
-                RP2Decimal("0"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'crypto_in' has non-positive value .*"):
-            # Bad crypto in
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "interESt",
-                RP2Decimal("1000"),
-                RP2Decimal("-2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'crypto_in' has non-RP2Decimal value .*"):
-            # Bad crypto in
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "interEst",
-                RP2Decimal("1000.0"),
-                "2.0002",  # type: ignore
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'fiat_fee' has non-positive value .*"):
-            # Bad fiat fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "inteREst",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("-20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'fiat_fee' has non-RP2Decimal value .*"):
-            # Bad fiat fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "intEREst",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee="20",  # type: ignore
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'fiat_in_no_fee' has non-positive value .*"):
-            # Bad fiat in no fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "inTEREst",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("-2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'fiat_in_no_fee' has non-RP2Decimal value .*"):
-            # Bad fiat in no fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "inTERESt",
-                RP2Decimal("1000.0"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee="2000.2",  # type: ignore
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2ValueError, "Parameter 'fiat_in_with_fee' has non-positive value .*"):
-            # Bad fiat in with fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "iNTERESt",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("-2020.2"),
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'fiat_in_with_fee' has non-RP2Decimal value .*"):
-            # Bad fiat in with fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTERESt",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=(1, 2, 3),  # type: ignore
-                row=19,
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'notes' has non-string value .*"):
-            # Bad notes
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTEREST",
-                RP2Decimal("1000.0"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-                notes=35.6,  # type: ignore
-            )
-        with self.assertRaisesRegex(RP2TypeError, "Parameter 'notes' has non-string value .*"):
-            # Bad notes
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTeREST",
-                RP2Decimal("1000.0"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-                notes=[1, 2, 3],  # type: ignore
-            )
-        with self.assertRaisesRegex(RP2ValueError, "both 'crypto_fee' and 'fiat_fee' are defined: only one allowed"):
-            # Bad notes
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTeREST",
-                RP2Decimal("1000.0"),
-                RP2Decimal("2.0002"),
-                crypto_fee=RP2Decimal("0.02"),
-                fiat_fee=RP2Decimal("20"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-
-        with self.assertLogs(level="WARNING") as log:
+        with self.assertRaisesRegex(RP2TypeError, _OUT_TRANSACTION_NOT_IN_TRANSACTION_RE):
+            InTransaction.type_check("my_instance", self._sample_out_transaction)
+        # Bad notes
+        for bad_notes in (35.6, _BAD_NOTES_LIST):
+            with self.subTest(notes=bad_notes):
+                self._assert_bad(RP2TypeError, _NOTES_NON_STRING_RE, notes=bad_notes)
+
+    def test_in_transaction_fiat_mismatch_warnings(self) -> None:
+        # Provided fiat amounts that don't match the computed ones are logged rather than rejected
+        for overrides, expected_message in [
             # Crypto in * spot price != fiat in (without fee)
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTerEST",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("1000"),
-                fiat_in_no_fee=RP2Decimal("1900.2"),
-                fiat_in_with_fee=RP2Decimal("2000.2"),
-                row=19,
-            )
-            self.assertTrue(re.search(".* InTransaction .*, id.*crypto_in.*spot_price != fiat_in_no_fee:.*", log.output[0]))
-
-        with self.assertLogs(level="WARNING") as log:
+            (
+                {"fiat_fee": _D_1000, "fiat_in_no_fee": _D_1900_2, "fiat_in_with_fee": _D_2000_2},
+                ", id 19): crypto_in * spot_price != fiat_in_no_fee: ",
+            ),
             # fiat in (with fee) != fiat in (without fee) + fiat fee
-            InTransaction(
-                self._configuration,
-                "2021-01-02T08:42:43.882Z",
-                "B1",
-                "BlockFi",
-                "Bob",
-                "INTerESt",
-                RP2Decimal("1000"),
-                RP2Decimal("2.0002"),
-                fiat_fee=RP2Decimal("18"),
-                fiat_in_no_fee=RP2Decimal("2000.2"),
-                fiat_in_with_fee=RP2Decimal("2020.2"),
-                row=19,
-            )
-            self.assertTrue(re.search(".* InTransaction .*, id.*fiat_in_with_fee != fiat_in_no_fee.*fiat_fee:.*", log.output[0]))
+            ({"fiat_fee": _D_18}, ", id 19): fiat_in_with_fee != fiat_in_no_fee + fiat_fee: "),
+        ]:
+            # Capturing on the rp2 logger itself swaps out its console and file handlers for the duration of the block
+            with self.subTest(overrides=overrides):
+                with self.assertLogs(LOGGER, level="WARNING") as log:
+                    InTransaction(**{**self._base_arguments, **overrides})
+                self.assertIn(" InTransaction (", log.output[0])
+                self.assertIn(expected_message, log.output[0])
 
 
 if __name__ == "__main__":
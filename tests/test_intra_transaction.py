@@ -16,12 +16,12 @@ import re
 import unittest
 
 from dateutil.tz import tzutc
+from rp2_test_configuration import get_test_data_configuration
 
 from rp2.configuration import Configuration
 from rp2.entry_types import TransactionType
 from rp2.in_transaction import InTransaction
 from rp2.intra_transaction import IntraTransaction
-from rp2.plugin.country.us import US
 from rp2.rp2_decimal import RP2Decimal
 from rp2.rp2_error import RP2TypeError, RP2ValueError
 
@@ -31,7 +31,7 @@ class TestIntraTransaction(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        TestIntraTransaction._configuration = Configuration("./config/test_data.ini", US())
+        TestIntraTransaction._configuration = get_test_data_configuration()
 
     def setUp(self) -> None:
         self.maxDiff = None  # pylint: disable=invalid-name
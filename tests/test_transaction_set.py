@@ -16,6 +16,7 @@ import unittest
 from typing import List, Optional, cast
 
 from dateutil.parser import parse
+from rp2_test_configuration import get_test_data_configuration
 
 from rp2.abstract_entry import AbstractEntry
 from rp2.abstract_transaction import AbstractTransaction
@@ -24,7 +25,6 @@ from rp2.entry_types import EntrySetType, TransactionType
 from rp2.in_transaction import InTransaction
 from rp2.intra_transaction import IntraTransaction
 from rp2.out_transaction import OutTransaction
-from rp2.plugin.country.us import US
 from rp2.rp2_decimal import RP2Decimal
 from rp2.rp2_error import RP2TypeError, RP2ValueError
 from rp2.transaction_set import TransactionSet
@@ -35,7 +35,7 @@ class TestTransactionSet(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        TestTransactionSet._configuration = Configuration("./config/test_data.ini", US())
+        TestTransactionSet._configuration = get_test_data_configuration()
 
     def setUp(self) -> None:
         self.maxDiff = None  # pylint: disable=invalid-name